@@ -1,31 +1,50 @@
 from flask import Flask, render_template, request, jsonify
+from flask.json.provider import DefaultJSONProvider
 from num2words import num2words
 from text2digits import text2digits
-import base64
+from functools import lru_cache
+import orjson
+import pybase64
 import re
+import string
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that serializes with orjson"""
+    def dumps(self, obj, **kwargs):
+        option = 0
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option).decode('utf-8')
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+
+# Deletion table for every ASCII character other than letters, whitespace and '-'
+_PUNCT_TABLE = str.maketrans('', '', ''.join(
+    c for c in map(chr, range(128))
+    if not (c in string.ascii_letters or c.isspace() or c == '-')
+))
+
+# Lookup table for the number words understood by text_to_number
+_WORD_TO_NUM = {
+    'zero': 0, 'nil': 0,
+    'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5,
+    'six': 6, 'seven': 7, 'eight': 8, 'nine': 9, 'ten': 10
+}
 
 def text_to_number(text):
     """Convert English text number to integer"""
-    # Remove any non-alphanumeric characters and convert to lowercase
-    text = re.sub(r'[^a-zA-Z\s-]', '', text.lower())
-    
-    # Special case for zero
-    if text in ['zero', 'nil']:
-        return 0
-    
-    # Dictionary for special number words
-    number_words = {
-        'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5,
-        'six': 6, 'seven': 7, 'eight': 8, 'nine': 9, 'ten': 10
-    }
-    
-    if text in number_words:
-        return number_words[text]
+    # Convert to lowercase, then drop non-ASCII characters, digits and punctuation
+    text = text.lower().encode('ascii', 'ignore').decode('ascii').translate(_PUNCT_TABLE)
     
-    raise ValueError("Unable to convert text to number")
+    try:
+        return _WORD_TO_NUM[text]
+    except KeyError:
+        raise ValueError("Unable to convert text to number")
 
+@lru_cache(maxsize=1024)
 def number_to_text(number):
     """Convert integer to English text"""
     try:
@@ -33,22 +52,28 @@ def number_to_text(number):
     except:
         raise ValueError("Unable to convert number to text")
 
+# Well-formed standard base64: complete quads with correct trailing padding
+_B64_RE = re.compile(r'(?:[A-Za-z0-9+/]{4})*(?:[A-Za-z0-9+/]{2}==|[A-Za-z0-9+/]{3}=)?')
+
 def base64_to_number(b64_str):
     """Convert base64 to integer"""
-    try:
-        # Decode base64 to bytes, then convert bytes to integer
-        decoded_bytes = base64.b64decode(b64_str)
-        return int.from_bytes(decoded_bytes, byteorder='big')
-    except:
+    if not isinstance(b64_str, str):
+        raise ValueError("Invalid base64 input")
+    # Ignore whitespace from pasted input, then validate before decoding
+    b64_str = ''.join(b64_str.split())
+    if not _B64_RE.fullmatch(b64_str):
         raise ValueError("Invalid base64 input")
+    # Decode base64 to bytes, then convert bytes to integer
+    decoded_bytes = pybase64.b64decode(b64_str)
+    return int.from_bytes(decoded_bytes, byteorder='big')
 
 def number_to_base64(number):
     """Convert integer to base64"""
     try:
         # Convert integer to bytes, then encode to base64
-        byte_count = (number.bit_length() + 7) // 8
+        byte_count = (number.bit_length() + 7) // 8 or 1
         number_bytes = number.to_bytes(byte_count, byteorder='big')
-        return base64.b64encode(number_bytes).decode('utf-8')
+        return pybase64.b64encode_as_string(number_bytes)
     except:
         raise ValueError("Unable to convert to base64")
 
@@ -56,49 +81,62 @@ def number_to_base64(number):
 def index():
     return render_template('index.html')
 
-@app.route('/convert', methods=['POST'])
-def convert():
+# Parsers from each input type to an integer
+_PARSERS = {
+    'text': text_to_number,
+    'binary': lambda s: int(s, 2),
+    'octal': lambda s: int(s, 8),
+    'decimal': int,
+    'hexadecimal': lambda s: int(s, 16),
+    'base64': base64_to_number,
+}
+
+# Formatters from an integer to each output type
+_FORMATTERS = {
+    'text': number_to_text,
+    'binary': '{:b}'.format,
+    'octal': '{:o}'.format,
+    'decimal': str,
+    'hexadecimal': '{:x}'.format,
+    'base64': number_to_base64,
+}
+
+def _convert(input_value, input_type, output_type):
+    """Convert input_value between types, returning a (result, error) pair"""
     try:
-        data = request.get_json()
-        input_value = data['input']
-        input_type = data['inputType']
-        output_type = data['outputType']
-        
-        # Convert input to integer based on input type
-        if input_type == 'text':
-            number = text_to_number(input_value)
-        elif input_type == 'binary':
-            number = int(input_value, 2)
-        elif input_type == 'octal':
-            number = int(input_value, 8)
-        elif input_type == 'decimal':
-            number = int(input_value)
-        elif input_type == 'hexadecimal':
-            number = int(input_value, 16)
-        elif input_type == 'base64':
-            number = base64_to_number(input_value)
-        else:
+        parse = _PARSERS.get(input_type) if isinstance(input_type, str) else None
+        if parse is None:
             raise ValueError("Invalid input type")
-            
-        # Convert integer to output type
-        if output_type == 'text':
-            result = number_to_text(number)
-        elif output_type == 'binary':
-            result = bin(number)[2:]  # Remove '0b' prefix
-        elif output_type == 'octal':
-            result = oct(number)[2:]  # Remove '0o' prefix
-        elif output_type == 'decimal':
-            result = str(number)
-        elif output_type == 'hexadecimal':
-            result = hex(number)[2:]  # Remove '0x' prefix
-        elif output_type == 'base64':
-            result = number_to_base64(number)
-        else:
+        format_output = _FORMATTERS.get(output_type) if isinstance(output_type, str) else None
+        if format_output is None:
             raise ValueError("Invalid output type")
             
-        return jsonify({'result': result, 'error': None})
+        return format_output(parse(input_value)), None
     except Exception as e:
-        return jsonify({'result': None, 'error': str(e)})
+        return None, str(e)
+
+_convert_cached = lru_cache(maxsize=4096, typed=True)(_convert)
+
+# Only short string inputs are cached, so large conversions are not kept alive
+_MAX_CACHED_INPUT = 64
+
+@app.route('/convert', methods=['POST'])
+def convert():
+    data = request.get_json(silent=True, cache=True)
+    if not isinstance(data, dict):
+        data = {}
+    input_value = data.get('input')
+    input_type = data.get('inputType')
+    output_type = data.get('outputType')
+    if input_value is None or input_type is None or output_type is None:
+        return jsonify({'result': None, 'error': 'Missing field'})
+        
+    cacheable = all(isinstance(v, str) for v in (input_value, input_type, output_type))
+    if cacheable and len(input_value) <= _MAX_CACHED_INPUT:
+        result, error = _convert_cached(input_value, input_type, output_type)
+    else:
+        result, error = _convert(input_value, input_type, output_type)
+    return jsonify({'result': result, 'error': error})
 
 if __name__ == '__main__':
     app.run(debug=True)